@@ -1,6 +1,45 @@
+import random
 import sys
 import time
-from typing import Callable, Iterable, List, Optional
+from concurrent.futures import (FIRST_COMPLETED, ProcessPoolExecutor,
+                                ThreadPoolExecutor, as_completed, wait)
+from functools import partial
+from itertools import islice
+from typing import Callable, Iterable, List, Optional, Tuple
+
+
+def _run_one(task: Callable, max_retries: int, backoff_base: float = 0.0,
+             backoff_cap: float = 0.0) -> Tuple[bool, int]:
+    """Call ``task`` retrying on failure.
+
+    Between retries this function sleeps, in the worker running it, for an
+    exponentially growing delay of ``backoff_base * 2**attempt`` scaled by a
+    random jitter factor in ``[0.5, 1.5)`` and then clamped to
+    ``backoff_cap``.
+
+    Returns a ``(succeeded, retries)`` tuple. Defined at module level so it
+    can be shipped to worker processes.
+    """
+    attempt = 0
+    while True:
+        try:
+            task()
+            return True, attempt
+        except Exception:
+            if attempt < max_retries:
+                delay = backoff_base * (2 ** attempt) * (0.5 + random.random())
+                delay = min(backoff_cap, delay)
+                if delay > 0:
+                    time.sleep(delay)
+                attempt += 1
+                continue
+            return False, attempt
+
+
+def _run_chunk(run_one: Callable, tasks: List[Callable]) -> List[Tuple[bool, int]]:
+    """Run a chunk of tasks in one worker round-trip."""
+    return [run_one(task) for task in tasks]
+
 
 class BatchExecutor:
     """Execute a sequence of callables with progress and retry logic.
@@ -8,42 +47,115 @@ class BatchExecutor:
     Parameters
     ----------
     tasks: Iterable[Callable]
-        Callables to execute. Each task is called with no arguments.
+        Callables to execute. Each task is called with no arguments. The
+        iterable is consumed lazily, so generators work without being
+        materialised up front.
     max_retries: int, optional
         Number of times to retry a failed task. Defaults to 0 (no retries).
     bar_width: int, optional
         Width of the textual progress bar. Defaults to 20 characters.
     out: file-like object, optional
         Stream where progress is written. Defaults to ``sys.stdout``.
+    max_workers: int, optional
+        Run tasks concurrently on a pool of this many workers. Defaults to
+        ``None`` which runs tasks one after another in the calling thread.
+    use_processes: bool, optional
+        Use a process pool instead of a thread pool when ``max_workers`` is
+        set. Tasks must then be picklable. Defaults to ``False``.
+    backoff_base: float, optional
+        Initial delay in seconds before the first retry; doubled after each
+        further failure. Defaults to 0.1 seconds.
+    backoff_cap: float, optional
+        Upper bound in seconds for the retry delay, applied after jitter.
+        Defaults to 5 seconds.
+    total: int, optional
+        Number of tasks, used for the progress bar and ETA. Defaults to
+        ``len(tasks)`` when ``tasks`` has a length, otherwise unknown.
     """
     def __init__(self, tasks: Iterable[Callable], max_retries: int = 0,
-                 bar_width: int = 20, out: Optional[object] = None) -> None:
-        self.tasks: List[Callable] = list(tasks)
+                 bar_width: int = 20, out: Optional[object] = None,
+                 max_workers: Optional[int] = None,
+                 use_processes: bool = False, backoff_base: float = 0.1,
+                 backoff_cap: float = 5.0, total: Optional[int] = None) -> None:
+        self.tasks: Iterable[Callable] = tasks
+        if total is None and hasattr(tasks, '__len__'):
+            total = len(tasks)  # type: ignore[arg-type]
+        self.total = total
         self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self.max_workers = max_workers
+        self.use_processes = use_processes
         self.bar_width = bar_width
         self.out = out or sys.stdout
+        self._full_bar = '=' * bar_width
+        self._empty_bar = ' ' * bar_width
+        self._last_draw = 0.0
 
     # ------------------------------------------------------------------
-    def _progress(self, completed: int, total: int, start: float) -> None:
-        """Render progress bar with ETA."""
+    def _progress(self, completed: int, total: Optional[int], start: float) -> None:
+        """Render progress bar with ETA.
+
+        Redraws are throttled to at most 20 per second; the final update is
+        always drawn. When ``total`` is unknown only the count is shown.
+        """
+        now = time.monotonic()
+        if completed != total and now - self._last_draw < 0.05:
+            return
+        self._last_draw = now
         elapsed = time.time() - start
+        if total is None:
+            self.out.write(f"\r{completed}/? elapsed {elapsed:5.1f}s")
+            self.out.flush()
+            return
         rate = elapsed / completed if completed else 0.0
         remaining = total - completed
         eta = remaining * rate
         pct = completed / total if total else 0.0
         filled = int(self.bar_width * pct)
-        bar = '[' + '=' * filled + ' ' * (self.bar_width - filled) + ']'
+        bar = '[' + self._full_bar[:filled] + self._empty_bar[filled:] + ']'
         msg = f"\r{bar} {completed}/{total} ({pct*100:5.1f}%) ETA {eta:5.1f}s"
         self.out.write(msg)
         self.out.flush()
 
     # ------------------------------------------------------------------
+    def _results(self):
+        """Yield ``(succeeded, retries)`` for each task as it finishes."""
+        run_one = partial(_run_one, max_retries=self.max_retries,
+                          backoff_base=self.backoff_base,
+                          backoff_cap=self.backoff_cap)
+        if not self.max_workers:
+            for task in self.tasks:
+                yield run_one(task)
+            return
+        if self.use_processes:
+            pool_cls = ProcessPoolExecutor
+            chunksize = max(1, (self.total or 0) // (4 * self.max_workers))
+        else:
+            pool_cls = ThreadPoolExecutor
+            chunksize = 1
+        it = iter(self.tasks)
+        chunks = iter(lambda: list(islice(it, chunksize)), [])
+        # Keep at most two chunks per worker in flight so the task iterable
+        # is only consumed as fast as workers drain it.
+        max_pending = 2 * self.max_workers
+        with pool_cls(max_workers=self.max_workers) as ex:
+            pending = set()
+            for chunk in chunks:
+                pending.add(ex.submit(_run_chunk, run_one, chunk))
+                if len(pending) >= max_pending:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for fut in done:
+                        yield from fut.result()
+            for fut in as_completed(pending):
+                yield from fut.result()
+
     def run(self) -> dict:
-        """Run all tasks in order.
+        """Run all tasks, in order unless ``max_workers`` is set.
 
         Returns a report dictionary containing counts and timings.
         """
-        total = len(self.tasks)
+        total = self.total
         stats = {
             'total': total,
             'succeeded': 0,
@@ -51,22 +163,14 @@ class BatchExecutor:
             'retries': 0,
         }
         start = time.time()
-        for i, task in enumerate(self.tasks, 1):
-            attempt = 0
-            while True:
-                try:
-                    task()
-                    stats['succeeded'] += 1
-                    break
-                except Exception:
-                    if attempt < self.max_retries:
-                        stats['retries'] += 1
-                        attempt += 1
-                        continue
-                    else:
-                        stats['failed'] += 1
-                        break
-            self._progress(i, total, start)
+        completed = 0
+        for completed, (ok, retries) in enumerate(self._results(), 1):
+            stats['succeeded' if ok else 'failed'] += 1
+            stats['retries'] += retries
+            self._progress(completed, total, start)
+        if total is None:
+            stats['total'] = completed
+            self._progress(completed, completed, start)
         self.out.write('\n')
         stats['elapsed'] = time.time() - start
         return stats
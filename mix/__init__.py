@@ -1,40 +1,63 @@
-"""Minimal audio mixing library using only the Python standard library."""
+"""Minimal audio mixing library built on the standard library and NumPy."""
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+import hashlib
 import json
+import os
+import shutil
 import wave
 import math
-import array
-import struct
 import subprocess
 import re
 
+import numpy as np
+
+try:  # pragma: no cover - optional dependency
+    import soundfile as sf  # type: ignore
+except Exception:  # pragma: no cover
+    sf = None  # type: ignore
+
 from .config import get_config
 
 _SOXR_LOGGED = False
+# Samples quantised and written per block in _save (64k samples ~ 192 KiB).
+_SAVE_BLOCK = 1 << 16
 
 
-def _load(path: Path, target_sr: int = 48000) -> tuple[list[float], int]:
-    """Load a mono WAV file and resample to ``target_sr`` if needed.
-
-    Audio is converted to float32 and resampled with ``soxr`` using
-    ``quality="best"`` when the input sample rate differs from ``target_sr``.
-    """
+def _read_wave(path: Path) -> tuple[np.ndarray, int]:
+    """Decode 16/24-bit PCM WAV with the standard library ``wave`` module."""
     with wave.open(str(path), "rb") as wf:
         sr = wf.getframerate()
         sw = wf.getsampwidth()
         frames = wf.readframes(wf.getnframes())
     if sw == 2:
-        ints = array.array("h", frames)
-        data = [s / 32768.0 for s in ints]
+        data = np.frombuffer(frames, dtype="<i2").astype(np.float32) * (1.0 / 32768.0)
     elif sw == 3:
-        data = []
-        for i in range(0, len(frames), 3):
-            b = frames[i : i + 3]
-            b += b"\xff" if b[2] & 0x80 else b"\x00"
-            data.append(int.from_bytes(b, "little", signed=True) / (2 ** 23))
+        raw = np.frombuffer(frames, dtype=np.uint8).reshape(-1, 3)
+        padded = np.empty((raw.shape[0], 4), dtype=np.uint8)
+        padded[:, :3] = raw
+        # sign-extend the most significant byte into the fourth byte
+        padded[:, 3] = np.where(raw[:, 2] & 0x80, 0xFF, 0x00)
+        data = padded.view("<i4").reshape(-1).astype(np.float32) * (1.0 / (1 << 23))
     else:
         raise ValueError("Unsupported sample width")
-    data = [struct.unpack("f", struct.pack("f", x))[0] for x in data]
+    return data, sr
+
+
+def _load(path: Path, target_sr: int = 48000) -> tuple[np.ndarray, int]:
+    """Load a mono WAV file and resample to ``target_sr`` if needed.
+
+    Audio is decoded to float32 by ``soundfile`` when available (falling back
+    to the ``wave`` module) and resampled with ``soxr`` using
+    ``quality="VHQ"`` (its best setting) when the input sample rate differs
+    from ``target_sr``.
+    """
+    if sf is not None:
+        data, sr = sf.read(str(path), dtype="float32")
+        # keep the interleaved layout the wave fallback produces
+        data = data.reshape(-1)
+    else:
+        data, sr = _read_wave(path)
     if sr != target_sr:
         try:
             import soxr  # type: ignore
@@ -44,47 +67,100 @@ def _load(path: Path, target_sr: int = 48000) -> tuple[list[float], int]:
                 _SOXR_LOGGED = True
         except Exception as exc:  # pragma: no cover - optional dependency
             raise RuntimeError("soxr library is required for resampling") from exc
-        data = list(soxr.resample(data, sr, target_sr, quality="best"))
-        data = [struct.unpack("f", struct.pack("f", x))[0] for x in data]
+        # soxr hands back float32 for float32 input, so no extra cast pass
+        data = soxr.resample(data.astype(np.float32, copy=False), sr, target_sr, quality="VHQ")
         sr = target_sr
     return data, sr
 
 
-def _save(path, data, sr):
-    import random
-    import struct
+def _save(path, data, sr, seed=None):
+    """Export ``data`` as 48 kHz/24-bit PCM with TPDF dither.
+
+    The dither comes from a PCG64 generator seeded with ``seed``; when no seed
+    is given it is drawn from NumPy's global state so that
+    :func:`mix.deterministic.enable_determinism` still makes exports
+    reproducible.
+    """
     path.parent.mkdir(parents=True, exist_ok=True)
     target_sr = 48000
     if sr != target_sr:
         raise ValueError("Sample rate must be 48kHz")
     # convert to float32 for uniform quantisation
-    data = [struct.unpack("f", struct.pack("f", x))[0] for x in data]
+    arr = np.asarray(data, dtype=np.float32)
     peak_limit = math.pow(10.0, -1.0 / 20.0)
-    peak = max((abs(x) for x in data), default=0.0)
+    peak = float(np.abs(arr).max(initial=0.0))
     if peak > peak_limit:
-        scale = peak_limit / peak
-        data = [x * scale for x in data]
+        arr = arr * np.float32(peak_limit / peak)
     head_gap = target_sr
     lsb = 1.0 / (2 ** 23)
     max_int = 2 ** 23 - 1
-    frames = bytearray(b"\x00\x00\x00" * head_gap)
-    for x in data:
-        y = x + (random.random() - random.random()) * lsb
-        y = max(-1.0, min(1.0 - lsb, y))
-        n = int(round(y * max_int))
-        frames.extend(n.to_bytes(3, "little", signed=True))
+    if seed is None:
+        seed = np.random.randint(0, 2 ** 63 - 1, dtype=np.int64)
+    rng = np.random.default_rng(seed)
     with wave.open(str(path), "wb") as wf:
         wf.setnchannels(1)
         wf.setsampwidth(3)
         wf.setframerate(target_sr)
-        wf.writeframes(frames)
-    with wave.open(str(path), "rb") as wf:
-        if wf.getsampwidth() != 3 or wf.getframerate() != target_sr:
-            raise ValueError("Export verification failed")
+        # Declaring the final length up front lets the header be written once
+        # instead of being patched after every block.
+        wf.setnframes(head_gap + arr.size)
+        wf.writeframesraw(b"\x00\x00\x00" * head_gap)
+        for start in range(0, arr.size, _SAVE_BLOCK):
+            block = arr[start : start + _SAVE_BLOCK]
+            # TPDF dither, clamp and quantise in place on one float64 buffer
+            # (float32 cannot resolve the 24-bit LSB near full scale), then
+            # keep the three low bytes of each little-endian int32 to obtain
+            # packed PCM_24.
+            y = rng.random(block.size)
+            y -= rng.random(block.size)
+            y *= lsb
+            y += block
+            np.clip(y, -1.0, 1.0 - lsb, out=y)
+            y *= max_int
+            np.rint(y, out=y)
+            ints = y.astype("<i4")
+            wf.writeframesraw(ints.view(np.uint8).reshape(-1, 4)[:, :3].tobytes())
+
+
+def _cache_dir() -> Path | None:
+    """Return the opt-in cache root from ``MIX_CACHE_DIR``, or ``None``."""
+    root = os.getenv("MIX_CACHE_DIR")
+    return Path(root) if root else None
+
+
+def _measure_key(path: Path) -> str:
+    """Hash the file contents together with the ffmpeg binary identity."""
+    h = hashlib.sha256()
+    ffmpeg = shutil.which("ffmpeg") or "ffmpeg"
+    try:
+        st = os.stat(ffmpeg)
+        h.update(f"{ffmpeg}:{st.st_size}:{st.st_mtime_ns}".encode())
+    except OSError:
+        h.update(ffmpeg.encode())
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
 
 
 def _measure(path: Path) -> tuple[float, float]:
-    """Measure LUFS and true peak using ``ffmpeg loudnorm``."""
+    """Measure LUFS and true peak using ``ffmpeg loudnorm``.
+
+    When ``MIX_CACHE_DIR`` is set, results are cached under
+    ``$MIX_CACHE_DIR/loudnorm`` keyed by the file contents, so re-measuring
+    an identical file skips the ffmpeg run.  Unseeded exports are dithered
+    randomly and never repeat, so caching is off by default.
+    """
+    cache_root = _cache_dir()
+    cache_file = None
+    if cache_root is not None:
+        cache_file = cache_root / "loudnorm" / f"{_measure_key(path)}.json"
+        try:
+            with open(cache_file, "r", encoding="utf-8") as f:
+                info = json.load(f)
+            return float(info["input_i"]), float(info["input_tp"])
+        except (OSError, ValueError, KeyError):
+            pass
     cmd = [
         "ffmpeg",
         "-hide_banner",
@@ -101,25 +177,43 @@ def _measure(path: Path) -> tuple[float, float]:
     if not match:
         raise RuntimeError("ffmpeg loudnorm output missing")
     info = json.loads(match.group(0))
+    if cache_file is not None:
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp = cache_file.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump({"input_i": info["input_i"], "input_tp": info["input_tp"]}, f)
+            os.replace(tmp, cache_file)
+        except OSError:  # pragma: no cover - cache is best effort
+            pass
     return float(info["input_i"]), float(info["input_tp"])
 
 
 def _rms_db(data):
-    if not data:
+    data = np.asarray(data, dtype=np.float32)
+    if not data.size:
         return -float("inf")
-    rms = math.sqrt(sum(x * x for x in data) / len(data))
+    rms = math.sqrt(float(np.dot(data, data)) / data.size)
     if rms == 0:
         return -float("inf")
     return 20 * math.log10(rms)
 
 
 def _apply_gain(data, gain_db):
+    data = np.asarray(data, dtype=np.float32)
+    if abs(gain_db) < 1e-6:
+        return data
     factor = math.pow(10.0, gain_db / 20.0)
-    return [x * factor for x in data]
+    return data * np.float32(factor)
 
 
 def _align_loudness(data, target_db):
+    data = np.asarray(data, dtype=np.float32)
+    # One dot product for the RMS and one multiply for the gain.
     loudness = _rms_db(data)
+    if loudness == -float("inf"):
+        # silent or empty: no finite gain can reach the target
+        return data, loudness, 0.0
     gain = target_db - loudness
     return _apply_gain(data, gain), loudness, gain
 
@@ -150,20 +244,24 @@ def process(
     }
     data_tracks = {}
     sr = None
-    for name in tracks:
-        stem_path = input_dir / f"{name}.wav"
-        if stem_path.exists():
-            data, sr = _load(stem_path)
-            norm, loudness, gain = _align_loudness(data, track_lufs)
+    existing = [name for name in tracks if (input_dir / f"{name}.wav").exists()]
+
+    def _prep(name):
+        data, stem_sr = _load(input_dir / f"{name}.wav")
+        norm, loudness, gain = _align_loudness(data, track_lufs)
+        return name, norm, stem_sr, loudness, gain
+
+    # Stems are independent; decoding and NumPy maths release the GIL.
+    with ThreadPoolExecutor(max_workers=max(1, min(len(existing), 8))) as ex:
+        for name, norm, sr, loudness, gain in ex.map(_prep, existing):
             data_tracks[name] = norm
             report["tracks"][name] = {"input_db": loudness, "gain_db": gain}
     if not data_tracks:
         raise FileNotFoundError("No stem files found in input directory")
     length = min(len(t) for t in data_tracks.values())
-    mix = [0.0] * length
+    mix = np.zeros(length, dtype=np.float32)
     for t in data_tracks.values():
-        for i in range(length):
-            mix[i] += t[i]
+        mix += t[:length]
     mix, _before_loudness, gain = _align_loudness(mix, mix_lufs)
     mix_path = output_dir / "mix.wav"
     _save(mix_path, mix, sr)
@@ -1,4 +1,6 @@
+from functools import lru_cache
 from pathlib import Path
+import copy
 import os
 import json
 
@@ -6,18 +8,28 @@ BASE_DIR = Path(__file__).resolve().parent.parent
 CONFIG_DIR = BASE_DIR / "configs"
 
 
+@lru_cache(maxsize=8)
+def _read_json(path: str, mtime_ns: int) -> dict:
+    """Parse a config file; ``mtime_ns`` keys the cache so edits are seen."""
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _load_json(path: Path) -> dict:
+    """Return a private copy of the cached contents of ``path``."""
+    return copy.deepcopy(_read_json(str(path), path.stat().st_mtime_ns))
+
+
 def get_config(profile: str | None = None) -> dict:
     """Load configuration with priority: ENV > YAML defaults."""
-    with open(CONFIG_DIR / "defaults.yaml", "r", encoding="utf-8") as f:
-        config = json.load(f)
+    config = _load_json(CONFIG_DIR / "defaults.yaml")
 
     # Determine profile
     profile = profile or os.getenv("MIX_PROFILE") or config.get("quality_profile")
     if profile:
         qp_path = CONFIG_DIR / "quality_profiles.yaml"
         if qp_path.exists():
-            with open(qp_path, "r", encoding="utf-8") as f:
-                profiles = json.load(f)
+            profiles = _load_json(qp_path)
             config.update(profiles.get(profile, {}))
         config["quality_profile"] = profile
 
@@ -5,8 +5,60 @@ import logging
 from pathlib import Path
 from typing import List
 
+import numpy as np
+
 CONFIG_PATH = Path(__file__).with_name("f0.yaml")
 
+_ZC_KERNEL = None
+
+
+def _zero_crossings(audio, size: int):
+    """Count negative-to-positive sign changes in each ``size``-sample window."""
+    n = audio.shape[0]
+    counts = np.zeros((n + size - 1) // size, dtype=np.int64)
+    for k in range(counts.shape[0]):
+        start = k * size
+        end = min(start + size, n)
+        zc = 0
+        for j in range(start + 1, end):
+            if audio[j - 1] < 0.0 and audio[j] >= 0.0:
+                zc += 1
+        counts[k] = zc
+    return counts
+
+
+def _zero_crossings_numpy(audio, size: int):
+    """Vectorised equivalent of :func:`_zero_crossings`.
+
+    Builds a sign mask once and flags rising crossings by comparing it with
+    itself shifted by one sample; crossings at window starts belong to no
+    window and are cleared before a segmented sum.
+    """
+    n = audio.shape[0]
+    if n == 0:
+        return np.zeros(0, dtype=np.int64)
+    neg = audio < 0.0
+    rising = np.zeros(n, dtype=bool)
+    np.logical_and(neg[:-1], ~neg[1:], out=rising[1:])
+    rising[::size] = False
+    return np.add.reduceat(rising, np.arange(0, n, size), dtype=np.int64)
+
+
+def _zero_crossing_kernel():
+    """Return ``_zero_crossings`` compiled with numba, if numba is installed.
+
+    Compilation happens on first use so importing :mod:`mix` stays cheap;
+    without numba the vectorised NumPy variant is used.
+    """
+    global _ZC_KERNEL
+    if _ZC_KERNEL is None:
+        try:  # pragma: no cover - optional dependency
+            from numba import njit
+            _ZC_KERNEL = njit(cache=True)(_zero_crossings)
+        except Exception:  # pragma: no cover
+            _ZC_KERNEL = _zero_crossings_numpy
+    return _ZC_KERNEL
+
 
 class F0Extractor:
     """Extract fundamental frequency with backend fallbacks.
@@ -66,17 +118,13 @@ class F0Extractor:
     def _simple_f0(self, audio: List[float], sr: int, window: float) -> List[float]:
         """Very small zero-crossing based pitch tracker.
 
-        Works offline and requires only the standard library.
+        Works offline; the counting loop is JIT-compiled when numba is
+        available and vectorised with NumPy otherwise.
         """
         size = max(int(window * sr), 1)
-        result = []
-        for i in range(0, len(audio), size):
-            chunk = audio[i : i + size]
-            if not chunk:
-                break
-            zero_crossings = sum(
-                1 for j in range(1, len(chunk)) if chunk[j - 1] < 0 <= chunk[j]
-            )
-            freq = zero_crossings * sr / (2 * len(chunk)) if len(chunk) else 0.0
-            result.append(freq)
-        return result
+        data = np.asarray(audio, dtype=np.float32)
+        counts = _zero_crossing_kernel()(data, size)
+        lengths = np.full(counts.shape[0], size, dtype=np.int64)
+        if counts.shape[0]:
+            lengths[-1] = data.shape[0] - size * (counts.shape[0] - 1)
+        return (counts * sr / (2 * lengths)).tolist()
@@ -7,24 +7,134 @@ returns an error string explaining the problem and a possible fix.  A
 """
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
+import os
 import shutil
+import struct
+import time
 import wave
 
-try:  # pragma: no cover - optional dependency
-    import torch  # type: ignore
-except Exception:  # pragma: no cover
-    torch = None  # type: ignore
+# torch is imported on first use so that importing this module stays cheap.
+torch = None  # type: ignore
+_TORCH_LOADED = False
+
+# Seconds a GPU memory reading is reused across repeated checks.
+_MEM_INFO_TTL = 2.0
+_mem_info_cache: tuple[object, float, tuple[int, int]] | None = None
+_ffmpeg_cache: str | None = None
+
+
+def _get_torch():
+    """Return the torch module, importing it lazily, or ``None``."""
+    global torch, _TORCH_LOADED
+    if torch is None and not _TORCH_LOADED:
+        _TORCH_LOADED = True
+        try:  # pragma: no cover - optional dependency
+            import torch as _torch  # type: ignore
+        except Exception:  # pragma: no cover
+            _torch = None
+        torch = _torch
+    return torch
+
+
+@lru_cache(maxsize=1)
+def _cuda_available(mod) -> bool:
+    """Cached ``torch.cuda.is_available()`` for the given torch module."""
+    return bool(mod) and hasattr(mod, "cuda") and bool(mod.cuda.is_available())
+
+
+def _nvml_memory(index: int = 0) -> tuple[int, int] | None:
+    """Return device-wide ``(free, total)`` bytes via NVML, or ``None``.
+
+    NVML reports memory used by every process on the device without creating
+    a CUDA context, so it is preferred when ``pynvml`` is installed.
+    """
+    try:  # pragma: no cover - optional dependency
+        import pynvml  # type: ignore
+    except Exception:  # pragma: no cover
+        return None
+    try:
+        pynvml.nvmlInit()
+    except Exception:  # pragma: no cover - no NVIDIA driver
+        return None
+    try:
+        info = pynvml.nvmlDeviceGetMemoryInfo(pynvml.nvmlDeviceGetHandleByIndex(index))
+        return int(info.free), int(info.total)
+    except Exception:  # pragma: no cover - device query failed
+        return None
+    finally:
+        pynvml.nvmlShutdown()
+
+
+def _query_gpu_memory(mod) -> tuple[int, int]:
+    """Return device-wide ``(free, total)`` bytes for CUDA device 0.
+
+    Integrated (unified-memory) devices report available host RAM.  Discrete
+    devices are queried through NVML when available; otherwise a single
+    ``mem_get_info`` call is made (its result is cached by :func:`_gpu_memory`).
+    """
+    cuda = mod.cuda
+    try:
+        props = cuda.get_device_properties(0)
+        if getattr(props, "is_integrated", False):
+            avail = os.sysconf("SC_AVPHYS_PAGES") * os.sysconf("SC_PAGE_SIZE")
+            return int(avail), int(props.total_memory)
+    except (AttributeError, ValueError, OSError):
+        pass
+    info = _nvml_memory(0)
+    if info is not None:
+        return info
+    return tuple(cuda.mem_get_info())  # type: ignore[attr-defined]
+
+
+def _gpu_memory(mod) -> tuple[int, int]:
+    """Return cached ``(free, total)`` GPU memory, refreshed after a short TTL."""
+    global _mem_info_cache
+    now = time.monotonic()
+    cached = _mem_info_cache
+    if cached is not None and cached[0] is mod and now - cached[1] <= _MEM_INFO_TTL:
+        return cached[2]
+    info = _query_gpu_memory(mod)
+    _mem_info_cache = (mod, now, info)
+    return info
+
+
+def _ffmpeg_path() -> str | None:
+    """``shutil.which("ffmpeg")``, remembered once ffmpeg has been found.
+
+    A failed lookup is not cached, so installing ffmpeg mid-session (e.g. in
+    a later notebook cell) is picked up on the next check.
+    """
+    global _ffmpeg_cache
+    if _ffmpeg_cache is None:
+        _ffmpeg_cache = shutil.which("ffmpeg")
+    return _ffmpeg_cache
+
+
+def invalidate_cache() -> None:
+    """Forget cached CUDA, memory and ffmpeg lookups."""
+    global _mem_info_cache, _ffmpeg_cache
+    _cuda_available.cache_clear()
+    _mem_info_cache = None
+    _ffmpeg_cache = None
 
 
 def check_gpu(min_free_mb: int = 1024) -> str | None:
-    """Validate that a CUDA device has at least ``min_free_mb`` free memory."""
-    if not torch or not hasattr(torch, "cuda") or not torch.cuda.is_available():
+    """Validate that a CUDA device has at least ``min_free_mb`` free memory.
+
+    CUDA availability is cached for the process and free memory for
+    ``_MEM_INFO_TTL`` seconds; call :func:`invalidate_cache` to force a
+    fresh query.
+    """
+    mod = _get_torch()
+    if not _cuda_available(mod):
         return (
             "CUDA GPU not available. Install a CUDA capable GPU or run on CPU."
         )
     try:
-        free_bytes, _total = torch.cuda.mem_get_info()  # type: ignore[attr-defined]
+        free_bytes, _total = _gpu_memory(mod)
     except Exception:  # pragma: no cover - API may not exist
         return "Unable to determine GPU memory. Ensure recent PyTorch installation."
     free_mb = free_bytes / 1024**2
@@ -50,24 +160,71 @@ def check_disk(path: str | Path, min_free_mb: int = 1024) -> str | None:
 
 def check_ffmpeg() -> str | None:
     """Verify that the ffmpeg executable is available on PATH."""
-    if not shutil.which("ffmpeg"):
+    if not _ffmpeg_path():
         return "ffmpeg executable not found. Install ffmpeg and ensure it is on PATH."
     return None
 
 
-def check_sample_rate(input_dir: str | Path | None, expected_sr: int = 48000) -> str | None:
-    """Confirm that all ``.wav`` files in ``input_dir`` have the expected sample rate."""
-    if not input_dir:
+def _wav_sample_rate(path: Path) -> int:
+    """Return the sample rate of a WAV file.
+
+    Plain PCM files whose ``fmt `` chunk directly follows the RIFF header are
+    parsed from the first 28 bytes; anything else goes through ``wave``.
+    """
+    if hasattr(os, "pread"):
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            head = os.pread(fd, 28, 0)  # one syscall, no buffered file object
+        finally:
+            os.close(fd)
+    else:  # pragma: no cover - platforms without pread (e.g. Windows)
+        with open(path, "rb") as fh:
+            head = fh.read(28)
+    if (
+        len(head) == 28
+        and head[0:4] == b"RIFF"
+        and head[8:16] == b"WAVEfmt "
+        and struct.unpack_from("<H", head, 20)[0] == 1
+    ):
+        return struct.unpack_from("<I", head, 24)[0]
+    with wave.open(str(path), "rb") as wf:
+        return wf.getframerate()
+
+
+def check_sample_rate(
+    input_dir: str | Path | None,
+    expected_sr: int = 48000,
+    early_stop: bool = False,
+) -> str | None:
+    """Confirm that all ``.wav`` files in ``input_dir`` have the expected sample rate.
+
+    With ``early_stop`` the files are checked one by one and only the first
+    mismatch is reported; otherwise headers are read concurrently and every
+    mismatch is listed.
+    """
+    if not input_dir or not Path(input_dir).is_dir():
         return None
-    input_dir = Path(input_dir)
-    errors = []
-    for wav_path in input_dir.glob("*.wav"):
-        with wave.open(str(wav_path), "rb") as wf:
-            sr = wf.getframerate()
-        if sr != expected_sr:
-            errors.append(
-                f"{wav_path.name} has sample rate {sr}Hz, expected {expected_sr}Hz."
-            )
+    with os.scandir(input_dir) as it:
+        paths = [Path(e.path) for e in it if e.name.endswith(".wav") and e.is_file()]
+    if not paths:
+        return None
+
+    def _error(wav_path: Path, sr: int) -> str:
+        return f"{wav_path.name} has sample rate {sr}Hz, expected {expected_sr}Hz."
+
+    if early_stop:
+        for wav_path in paths:
+            sr = _wav_sample_rate(wav_path)
+            if sr != expected_sr:
+                return _error(wav_path, sr)
+        return None
+    with ThreadPoolExecutor(max_workers=min(32, len(paths))) as ex:
+        rates = list(ex.map(_wav_sample_rate, paths))
+    errors = [
+        _error(wav_path, sr)
+        for wav_path, sr in zip(paths, rates)
+        if sr != expected_sr
+    ]
     if errors:
         return "; ".join(errors)
     return None
@@ -2,15 +2,39 @@ import os
 import glob
 import logging
 import threading
+import time
+from functools import lru_cache
 
 DEFAULT_MODEL_PATH = "/content/drive/MyDrive/models/RVC/G_8200.pth"
 DISCOVERY_PATTERN = "/content/drive/MyDrive/models/RVC/*.pth"
 ENV_VAR = "RVC_MODEL"
 
 
+# Seconds a discovery result is reused; keeps repeated lookups off slow mounts.
+DISCOVERY_TTL = 5.0
+
+
+@lru_cache(maxsize=8)
+def _discover_cached(pattern: str, bucket: int):
+    return tuple(sorted(glob.glob(pattern)))
+
+
 def discover_models(pattern: str = DISCOVERY_PATTERN):
-    """Return a sorted list of available model files."""
-    return sorted(glob.glob(pattern))
+    """Return a sorted list of available model files.
+
+    Results are cached for up to ``DISCOVERY_TTL`` seconds; call
+    ``discover_models.cache_clear()`` to rescan immediately.  An empty
+    result is not kept, so a model uploaded after a miss is found on the
+    next call.
+    """
+    bucket = int(time.monotonic() // DISCOVERY_TTL)
+    found = _discover_cached(pattern, bucket)
+    if not found:
+        _discover_cached.cache_clear()
+    return list(found)
+
+
+discover_models.cache_clear = _discover_cached.cache_clear
 
 
 def _select_model(candidates):
@@ -9,12 +9,28 @@ from __future__ import annotations
 
 from array import array
 from dataclasses import dataclass
+from functools import lru_cache
+import threading
 from typing import Callable, Sequence
 
+import numpy as np
+
+try:  # pragma: no cover - optional dependency
+    from scipy.signal import fftconvolve  # type: ignore
+except Exception:  # pragma: no cover
+    fftconvolve = None  # type: ignore
+
+# Per-thread float32 scratch space for temporaries such as ``abs(data)``.
+_SCRATCH = threading.local()
+
 
 @dataclass
 class RVCInferenceConfig:
-    """Configuration parameters for RVC inference."""
+    """Configuration parameters for RVC inference.
+
+    Audio is processed internally as contiguous float32 NumPy arrays;
+    ``dtype`` describes the ``array`` typecode of the public results.
+    """
 
     dtype: str = "f"  # float32
     peak_db: float = -1.0
@@ -28,55 +44,111 @@ def as_array(audio: Sequence[float]) -> array:
     return array("f", audio)
 
 
+def _as_f32(audio: Sequence[float]) -> np.ndarray:
+    """Return ``audio`` as a contiguous float32 ndarray."""
+    return np.ascontiguousarray(audio, dtype=np.float32)
+
+
+def _to_array(data: np.ndarray) -> array:
+    """Materialise a float32 ndarray as ``array('f')`` for the public API."""
+    return array("f", data.tobytes())
+
+
+def _scratch(n: int) -> np.ndarray:
+    """Return an ``n``-sample float32 scratch view, growing the buffer as needed."""
+    buf = getattr(_SCRATCH, "buf", None)
+    if buf is None or buf.size < n:
+        buf = np.empty(n, dtype=np.float32)
+        _SCRATCH.buf = buf
+    return buf[:n]
+
+
+@lru_cache(maxsize=32)
+def _db_to_lin(db: float) -> float:
+    """Convert a dBFS level to linear amplitude (cached per level)."""
+    return 10.0 ** (db / 20.0)
+
+
+def _peak_guard(data: np.ndarray, peak_db: float, inplace: bool = False) -> np.ndarray:
+    """Return ``data`` scaled so its peak does not exceed ``peak_db``.
+
+    Unless ``inplace`` is set, ``data`` is never modified and a new array is
+    allocated only when scaling is required.
+    """
+    limit = _db_to_lin(peak_db)
+    peak = float(np.abs(data, out=_scratch(data.size)).max(initial=0.0))
+    if peak <= limit:
+        return data
+    return np.multiply(data, np.float32(limit / peak), out=data if inplace else None)
+
+
 def peak_guard(audio: Sequence[float], peak_db: float) -> array:
     """Limit audio to the requested peak level."""
-    data = as_array(audio)
-    limit = 10 ** (peak_db / 20.0)
-    peak = max((abs(x) for x in data), default=0.0)
-    if peak > limit and peak > 0.0:
-        factor = limit / peak
-        data = array("f", (x * factor for x in data))
-    return data
+    return _to_array(_peak_guard(_as_f32(audio), peak_db))
 
 
-def time_align(reference: Sequence[float], target: Sequence[float], sr: int, max_shift: float) -> array:
-    """Align ``target`` to ``reference`` using brute-force correlation."""
-    ref = as_array(reference)
-    tgt = as_array(target)
+def _xcorr(ref: np.ndarray, tgt: np.ndarray) -> np.ndarray:
+    """Full cross-correlation; index ``k`` holds lag ``k - (len(ref) - 1)``."""
+    if fftconvolve is not None:
+        return fftconvolve(tgt, ref[::-1], mode="full")
+    n = ref.size + tgt.size - 1
+    nfft = 1 << (n - 1).bit_length()
+    spec = np.fft.rfft(tgt, nfft) * np.fft.rfft(ref[::-1], nfft)
+    return np.fft.irfft(spec, nfft)[:n]
+
+
+def _time_align(ref: np.ndarray, tgt: np.ndarray, sr: int, max_shift: float) -> np.ndarray:
+    """Return ``tgt`` shifted onto ``ref`` and trimmed/padded to its length."""
     max_samples = int(max_shift * sr)
-    best_shift = 0
-    best_corr = float("-inf")
-    for shift in range(-max_samples, max_samples + 1):
-        corr = 0.0
-        for i, r in enumerate(ref):
-            j = i + shift
-            if 0 <= j < len(tgt):
-                corr += r * tgt[j]
-        if corr > best_corr:
-            best_corr = corr
-            best_shift = shift
-    if best_shift > 0:
-        tgt = tgt[best_shift:]
-    elif best_shift < 0:
-        tgt = array("f", [0.0] * (-best_shift)) + tgt
-    if len(tgt) < len(ref):
-        tgt.extend([0.0] * (len(ref) - len(tgt)))
+    window = np.zeros(2 * max_samples + 1, dtype=np.float64)
+    lo = max(-max_samples, 1 - ref.size)
+    hi = min(max_samples, tgt.size - 1)
+    if ref.size and tgt.size and lo <= hi:
+        corr = _xcorr(ref, tgt)
+        centre = ref.size - 1
+        window[lo + max_samples:hi + max_samples + 1] = corr[centre + lo:centre + hi + 1]
+    best_shift = int(np.argmax(window)) - max_samples
+
+    out = np.zeros(ref.size, dtype=np.float32)
+    if best_shift >= 0:
+        src = tgt[best_shift:best_shift + ref.size]
+        out[:src.size] = src
     else:
-        del tgt[len(ref):]
-    return tgt
+        src = tgt[:max(ref.size + best_shift, 0)]
+        out[-best_shift:-best_shift + src.size] = src
+    return out
+
+
+def time_align(reference: Sequence[float], target: Sequence[float], sr: int, max_shift: float) -> array:
+    """Align ``target`` to ``reference`` using FFT cross-correlation.
+
+    The lag is searched within ``±max_shift`` seconds; lags where the
+    signals do not overlap count as zero correlation.
+    """
+    return _to_array(_time_align(_as_f32(reference), _as_f32(target), sr, max_shift))
 
 
 def run(
-    model: Callable[[array], Sequence[float]],
+    model: Callable[[np.ndarray], Sequence[float]],
     audio: Sequence[float],
     cfg: RVCInferenceConfig | None = None,
 ) -> array:
-    """Run an RVC model with pre/post processing."""
+    """Run an RVC model with pre/post processing.
+
+    ``model`` receives the guarded input as a float32 ndarray.  When no
+    limiting was needed this is a read-only view of ``audio``, so a model
+    that writes to its input raises instead of corrupting the caller's
+    buffer.  Intermediate stages stay in NumPy and only the result is
+    converted to ``array('f')``.
+    """
     if cfg is None:
         cfg = RVCInferenceConfig()
-    x = peak_guard(audio, cfg.peak_db - cfg.guard_db)
-    y_raw = model(as_array(x))
-    y = as_array(y_raw)
-    y = time_align(x, y, cfg.sr, cfg.align_max)
-    y = peak_guard(y, cfg.peak_db)
-    return y
+    # float32 arrays and ndarrays are viewed, not copied, on the way in
+    x = _peak_guard(_as_f32(audio), cfg.peak_db - cfg.guard_db)
+    if x is audio or not x.flags.owndata:
+        x = x.view()
+        x.flags.writeable = False
+    y = _as_f32(model(x))
+    y = _time_align(x, y, cfg.sr, cfg.align_max)
+    y = _peak_guard(y, cfg.peak_db, inplace=True)  # y is owned by _time_align
+    return _to_array(y)
@@ -9,9 +9,17 @@ ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
-from mix import process
-from batch_executor import BatchExecutor
-from mix.deterministic import enable_determinism
+
+def _mix_song(song_dir, out_dir, seed=None):
+    """Mix one song; reseed first so output does not depend on scheduling."""
+    from mix import process
+
+    if seed is not None:
+        # mix.deterministic imports torch, so only load it when seeding
+        from mix.deterministic import enable_determinism
+
+        enable_determinism(seed)
+    process(song_dir, out_dir)
 
 
 def main():
@@ -27,18 +35,37 @@ def main():
         type=int,
         help="set random seed and enable deterministic backends",
     )
+    parser.add_argument("--workers", type=int, default=1,
+                        help="number of songs to mix in parallel processes")
+    parser.add_argument("--skip-existing", action="store_true",
+                        help="skip songs whose output folder already has report.json")
     args = parser.parse_args()
-    if args.seed is not None:
-        enable_determinism(args.seed)
+
+    # Heavy imports are deferred so that ``--help`` stays fast.  Seeding
+    # happens per song in ``_mix_song``.
+    from batch_executor import BatchExecutor
+
     tasks = []
+    skipped = 0
     for song_dir in Path(args.input_root).iterdir():
         if song_dir.is_dir():
             out_dir = Path(args.output_root) / song_dir.name
-            tasks.append(partial(process, song_dir, out_dir))
+            if args.skip_existing and (out_dir / "report.json").exists():
+                skipped += 1
+                continue
+            tasks.append(partial(_mix_song, song_dir, out_dir, args.seed))
+    if skipped:
+        print(f"Skipped {skipped} already mixed song(s).")
     if not tasks:
-        print("No song folders found.")
+        print("Nothing left to mix." if skipped else "No song folders found.")
         return
-    executor = BatchExecutor(tasks, max_retries=args.retries)
+    workers = max(1, args.workers)
+    executor = BatchExecutor(
+        tasks,
+        max_retries=args.retries,
+        max_workers=workers if workers > 1 else None,
+        use_processes=True,
+    )
     report = executor.run()
     print(f"Completed: {report['succeeded']} succeeded, {report['failed']} failed, "
           f"retries: {report['retries']}, elapsed: {report['elapsed']:.1f}s")
@@ -17,16 +17,10 @@ from pathlib import Path
 import tempfile
 import sys
 
-import soundfile as sf
-
 ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
-from mix import process
-from mix.model_manager import get_model_path
-from mix.rvc import run as rvc_run, RVCInferenceConfig
-
 
 def _separate(input_file: Path, work_dir: Path) -> Path:
     """Run Demucs source separation and return directory with stems.
@@ -48,12 +42,15 @@ def _separate(input_file: Path, work_dir: Path) -> Path:
 
 def _convert_vocals(vocal_path: Path, model_path: str, f0_method: str) -> None:
     """Replace the vocal track with an RVC-converted version."""
-    audio, sr = sf.read(vocal_path)
+    import soundfile as sf
+    from mix.rvc import run as rvc_run, RVCInferenceConfig
+
+    audio, sr = sf.read(vocal_path, dtype="float32")
     # TODO: replace the identity model with a real RVC inference call.
     def identity_model(x):
         return x
 
-    converted = rvc_run(identity_model, audio.tolist(), RVCInferenceConfig(sr=sr))
+    converted = rvc_run(identity_model, audio, RVCInferenceConfig(sr=sr))
     sf.write(vocal_path, converted, sr)
 
 
@@ -65,6 +62,9 @@ def main() -> None:
     parser.add_argument("--f0_method", default="rmvpe", help="pitch extraction method")
     args = parser.parse_args()
 
+    from mix import process
+    from mix.model_manager import get_model_path
+
     model_path = get_model_path(args.rvc_model)
     inp = Path(args.input)
 
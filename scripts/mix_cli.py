@@ -9,16 +9,6 @@ ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
-try:
-    import torch
-except Exception:  # pragma: no cover
-    torch = None
-
-from mix import process
-try:
-    from mix.deterministic import enable_determinism
-except Exception:  # pragma: no cover
-    enable_determinism = None
 
 def main():
     parser = argparse.ArgumentParser(
@@ -33,6 +23,19 @@ def main():
         help="set random seed and enable deterministic backends",
     )
     args = parser.parse_args()
+
+    # Heavy imports are deferred so that ``--help`` stays fast.
+    try:
+        import torch
+    except Exception:  # pragma: no cover
+        torch = None
+
+    from mix import process
+    try:
+        from mix.deterministic import enable_determinism
+    except Exception:  # pragma: no cover
+        enable_determinism = None
+
     if args.seed is not None and enable_determinism is not None:
         enable_determinism(args.seed)
     device = "cuda" if (torch and torch.cuda.is_available()) else "cpu"
@@ -9,9 +9,7 @@ ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
-from mix import process
 from pipeline_common import build_parser, resolve_rvc_model
-from mix.deterministic import enable_determinism
 
 
 def main() -> None:
@@ -19,10 +17,14 @@ def main() -> None:
     args = parser.parse_args()
     resolve_rvc_model(args)
     if args.seed is not None:
+        from mix.deterministic import enable_determinism
+
         enable_determinism(args.seed)
     if args.dry_run:
         print("Dry run: no processing performed")
         return
+    from mix import process
+
     report = process(Path(args.input), Path(args.output))
     print(json.dumps(report, indent=2))
 
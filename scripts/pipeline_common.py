@@ -3,8 +3,6 @@
 import argparse
 import os
 
-from mix import model_manager
-
 
 def build_parser() -> argparse.ArgumentParser:
     """Create argument parser with unified options for all pipeline scripts."""
@@ -32,6 +30,7 @@ def resolve_rvc_model(args):
 
     A notebook dropdown is offered when multiple models are available.
     """
+    from mix import model_manager
 
     def _in_notebook() -> bool:
         try:
@@ -1,6 +1,31 @@
+import shutil
 import sys
 from pathlib import Path
 
+import pytest
+
 ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
+
+# Resolved once per session; modules opt in with ``pytest.mark.requires_ffmpeg``.
+FFMPEG = shutil.which("ffmpeg")
+
+
+@pytest.fixture(autouse=True)
+def _no_mix_cache(monkeypatch):
+    """Run with the loudnorm cache off unless a test enables it itself."""
+    monkeypatch.delenv("MIX_CACHE_DIR", raising=False)
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "requires_ffmpeg: skip when ffmpeg is not on PATH")
+
+
+def pytest_collection_modifyitems(config, items):
+    if FFMPEG is not None:
+        return
+    skip = pytest.mark.skip(reason="ffmpeg not installed")
+    for item in items:
+        if "requires_ffmpeg" in item.keywords:
+            item.add_marker(skip)
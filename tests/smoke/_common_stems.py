@@ -0,0 +1,31 @@
+"""Tone and stem generators shared by the smoke tests."""
+from functools import lru_cache
+import math
+import wave
+
+import numpy as np
+
+
+@lru_cache(maxsize=64)
+def _tone_bytes(freq, duration, sr):
+    """Return the 16-bit PCM payload of a sine tone (cached per tone)."""
+    t = np.arange(int(duration * sr), dtype=np.float64)
+    ints = (np.clip(np.sin(2 * math.pi * freq * t / sr), -1.0, 1.0) * 32767).astype("<i2")
+    return ints.tobytes()
+
+
+def write_tone(path, freq, duration=5, sr=48000):
+    """Generate a mono sine wave and write it as a WAV file."""
+    payload = _tone_bytes(freq, duration, sr)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with wave.open(str(path), "wb") as wf:
+        # Known frame count up front, so close() needs no header patch.
+        wf.setparams((1, 2, sr, len(payload) // 2, "NONE", "not compressed"))
+        wf.writeframesraw(payload)
+
+
+def make_stems(directory, sr=48000, duration=5):
+    """Write the four standard test stems into ``directory``."""
+    freqs = {"vocals": 440, "drums": 220, "bass": 110, "other": 330}
+    for name, freq in freqs.items():
+        write_tone(directory / f"{name}.wav", freq, duration=duration, sr=sr)
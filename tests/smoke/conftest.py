@@ -0,0 +1,33 @@
+import shutil
+
+import pytest
+
+from tests.smoke._common_stems import make_stems
+
+
+@pytest.fixture(scope="session")
+def _stem_templates(tmp_path_factory):
+    """Render each stem set once per session, keyed by rate and duration."""
+    cache = {}
+
+    def _get(sr, duration):
+        key = (sr, duration)
+        if key not in cache:
+            directory = tmp_path_factory.mktemp(f"stems_{sr}")
+            make_stems(directory, sr=sr, duration=duration)
+            cache[key] = directory
+        return cache[key]
+
+    return _get
+
+
+@pytest.fixture
+def stems(_stem_templates, tmp_path):
+    """Return a factory copying the cached stems into ``tmp_path/input``."""
+
+    def _copy(sr=48000, duration=5):
+        dst = tmp_path / "input"
+        shutil.copytree(_stem_templates(sr, duration), dst)
+        return dst
+
+    return _copy
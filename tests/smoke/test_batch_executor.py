@@ -25,3 +25,59 @@ def test_batch_executor_retry(capsys):
     assert report['succeeded'] == 2
     assert report['failed'] == 1
     assert report['retries'] == 2
+
+
+def test_batch_executor_thread_pool(capsys):
+    done = []
+
+    def make_task(i):
+        def task():
+            if i == 3:
+                raise RuntimeError('boom')
+            done.append(i)
+        return task
+
+    executor = BatchExecutor([make_task(i) for i in range(8)], max_workers=4)
+    report = executor.run()
+    out = capsys.readouterr().out.replace('\r', '\n')
+    lines = [ln for ln in out.splitlines() if ln.strip()]
+    assert '8/8' in lines[-1]
+    assert sorted(done) == [0, 1, 2, 4, 5, 6, 7]
+    assert report['succeeded'] == 7
+    assert report['failed'] == 1
+    assert report['retries'] == 0
+
+
+def test_batch_executor_generator(capsys):
+    tasks = (lambda: None for _ in range(5))
+    report = BatchExecutor(tasks, max_workers=2).run()
+    out = capsys.readouterr().out.replace('\r', '\n')
+    lines = [ln for ln in out.splitlines() if ln.strip()]
+    assert '5/5' in lines[-1]
+    assert report['total'] == 5
+    assert report['succeeded'] == 5
+
+
+def test_batch_executor_backoff(monkeypatch):
+    import batch_executor
+
+    delays = []
+    monkeypatch.setattr(batch_executor.time, 'sleep', delays.append)
+
+    def task_fail():
+        raise RuntimeError('always fail')
+
+    # jitter factor 1.0: delays double from the base until the cap
+    monkeypatch.setattr(batch_executor.random, 'random', lambda: 0.5)
+    BatchExecutor([task_fail], max_retries=5, backoff_base=0.5,
+                  backoff_cap=3.0).run()
+    assert delays == [0.5, 1.0, 2.0, 3.0, 3.0]
+
+    # maximum jitter must still respect the cap
+    delays.clear()
+    monkeypatch.setattr(batch_executor.random, 'random', lambda: 0.999)
+    BatchExecutor([task_fail], max_retries=4, backoff_base=1.0,
+                  backoff_cap=2.5).run()
+    assert delays[0] > 1.0
+    assert all(d <= 2.5 for d in delays)
+    assert delays[-1] == 2.5
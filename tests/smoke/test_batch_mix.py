@@ -0,0 +1,43 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+from tests.smoke._common_stems import make_stems
+
+SCRIPTS = Path(__file__).resolve().parents[2] / "scripts"
+if str(SCRIPTS) not in sys.path:
+    sys.path.insert(0, str(SCRIPTS))
+
+import batch_mix  # noqa: E402
+
+pytestmark = pytest.mark.requires_ffmpeg
+
+
+def _run(monkeypatch, *argv):
+    monkeypatch.setattr(sys, "argv", ["batch_mix.py", *argv])
+    batch_mix.main()
+
+
+def test_batch_mix_workers_and_skip_existing(tmp_path, monkeypatch, capsys):
+    inp = tmp_path / "in"
+    out = tmp_path / "out"
+    for song in ("a", "b"):
+        make_stems(inp / song, duration=1)
+
+    _run(monkeypatch, str(inp), str(out), "--workers", "2", "--skip-existing")
+    assert "2 succeeded, 0 failed" in capsys.readouterr().out
+    for song in ("a", "b"):
+        assert (out / song / "mix.wav").exists()
+        assert (out / song / "report.json").exists()
+
+    (out / "b" / "report.json").unlink()
+    _run(monkeypatch, str(inp), str(out), "--workers", "2", "--skip-existing")
+    text = capsys.readouterr().out
+    assert "Skipped 1 already mixed song(s)." in text
+    assert "1 succeeded, 0 failed" in text
+
+    _run(monkeypatch, str(inp), str(out), "--skip-existing")
+    text = capsys.readouterr().out
+    assert "Skipped 2 already mixed song(s)." in text
+    assert "Nothing left to mix." in text
@@ -2,9 +2,9 @@ import wave
 from pathlib import Path
 
 import pytest
-import shutil
 torch = pytest.importorskip("torch")  # type: ignore
-pytestmark = pytest.mark.skipif(shutil.which("ffmpeg") is None, reason="ffmpeg not installed")
+_HAS_CUDA = torch.cuda.is_available()
+pytestmark = pytest.mark.requires_ffmpeg
 
 from mix import _align_loudness, _save, _measure
 
@@ -12,7 +12,7 @@ from mix import _align_loudness, _save, _measure
 def _render(device: str, path: Path):
     sr = 48000
     t = torch.arange(0, sr, device=device, dtype=torch.float32) / sr
-    audio = torch.sin(2 * torch.pi * 440 * t).cpu().tolist()
+    audio = torch.sin(2 * torch.pi * 440 * t).cpu().numpy()
     norm, _, _ = _align_loudness(audio, -14.0)
     _save(path, norm, sr)
     with wave.open(str(path), "rb") as wf:
@@ -23,7 +23,7 @@ def _render(device: str, path: Path):
     return lufs, tp_db, length
 
 
-@pytest.mark.skipif(not torch.cuda.is_available(), reason="CUDA not available")
+@pytest.mark.skipif(not _HAS_CUDA, reason="CUDA not available")
 def test_cpu_gpu_parity(tmp_path):
     cpu_path = tmp_path / "mix_cpu.wav"
     gpu_path = tmp_path / "mix_gpu.wav"
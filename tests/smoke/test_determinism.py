@@ -1,4 +1,4 @@
-import array
+import math
 import wave
 
 import pytest
@@ -6,34 +6,36 @@ import pytest
 from mix import process
 from mix.deterministic import enable_determinism, stft
 
-from tests.smoke.test_mix import _make_stems
-
 torch = pytest.importorskip("torch")
+_HAS_CUDA = torch.cuda.is_available()
 
 
 def _peak_db(tensor):
-    peak = torch.max(torch.abs(tensor))
+    peak = tensor.abs().amax()
     if peak == 0:
         return -float("inf")
-    return 20 * torch.log10(peak).item()
+    return (20 * torch.log10(peak)).item()
+
+
+def _rms_db(tensor):
+    rms = torch.linalg.vector_norm(tensor) / math.sqrt(tensor.numel())
+    return (20 * torch.log10(rms)).item()
 
 
-def test_cpu_gpu_alignment(tmp_path):
+def test_cpu_gpu_alignment(tmp_path, stems):
     enable_determinism(0)
-    inp = tmp_path / "input"
-    _make_stems(inp)
+    inp = stems()
     out = tmp_path / "out"
     report = process(inp, out)
     mix_path = out / "mix.wav"
     with wave.open(str(mix_path), "rb") as wf:
         frames = wf.readframes(wf.getnframes())
-    ints = array.array("h", frames)
-    data = torch.tensor([s / 32768.0 for s in ints], dtype=torch.float32)
+    data = torch.frombuffer(bytearray(frames), dtype=torch.int16).to(torch.float32).mul_(1.0 / 32768.0)
 
-    cpu_lufs = 20 * torch.log10(torch.sqrt(torch.mean(data ** 2))).item()
+    cpu_lufs = _rms_db(data)
     assert abs(cpu_lufs - report["mix_lufs"]) < 1e-6
 
-    if not (torch and torch.cuda.is_available()):
+    if not _HAS_CUDA:
         pytest.skip("CUDA not available")
 
     spec_cpu = stft(data)
@@ -41,7 +43,7 @@ def test_cpu_gpu_alignment(tmp_path):
     max_diff = torch.max(torch.abs(spec_cpu - spec_gpu)).item()
     assert max_diff < 1e-6
 
-    gpu_lufs = 20 * torch.log10(torch.sqrt(torch.mean((data.to("cuda") ** 2)))).item()
+    gpu_lufs = _rms_db(data.to("cuda"))
     assert abs(cpu_lufs - gpu_lufs) < 0.1
 
     peak_cpu = _peak_db(data)
@@ -1,9 +1,17 @@
 import math
-from mix.f0 import F0Extractor
+
+import numpy as np
+
+from mix.f0 import (
+    F0Extractor,
+    _zero_crossing_kernel,
+    _zero_crossings,
+    _zero_crossings_numpy,
+)
 
 
 def _sine(freq=440, duration=0.1, sr=16000):
-    return [math.sin(2 * math.pi * freq * i / sr) for i in range(int(duration * sr))]
+    return np.sin(2 * math.pi * freq * np.arange(int(duration * sr)) / sr)
 
 
 def test_f0_fallback_and_consistency():
@@ -15,3 +23,27 @@ def test_f0_fallback_and_consistency():
     # average absolute difference across shared length
     diff = sum(abs(a - b) for a, b in zip(gpu, cpu)) / min(len(gpu), len(cpu))
     assert diff < 1.0
+
+
+def _crossing_cases():
+    rng = np.random.default_rng(0)
+    noise = rng.standard_normal(1003).astype(np.float32)
+    noise[::7] = 0.0  # exact zeros count as non-negative
+    yield np.zeros(0, dtype=np.float32), 4
+    for size in (1, 2, 10, 64, 1003, 2000):  # 1003 is not divisible by most
+        yield noise, size
+    yield _sine(duration=0.05).astype(np.float32), 37
+
+
+def test_zero_crossings_numpy_matches_loop():
+    for audio, size in _crossing_cases():
+        expected = _zero_crossings(audio, size)
+        got = _zero_crossings_numpy(audio, size)
+        assert got.dtype == np.int64
+        assert got.tolist() == expected.tolist(), size
+
+
+def test_zero_crossing_kernel_matches_loop():
+    kernel = _zero_crossing_kernel()
+    for audio, size in _crossing_cases():
+        assert np.asarray(kernel(audio, size)).tolist() == _zero_crossings(audio, size).tolist(), size
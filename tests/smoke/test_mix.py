@@ -1,34 +1,15 @@
 from pathlib import Path
-import math
 import wave
-import array
 import pytest
-import shutil
 from mix import process
 
-pytestmark = pytest.mark.skipif(shutil.which("ffmpeg") is None, reason="ffmpeg not installed")
+from tests.smoke._common_stems import write_tone
 
+pytestmark = pytest.mark.requires_ffmpeg
 
-def _write_tone(path, freq, duration=5, sr=48000):
-    """Generate a mono sine wave and write it as a WAV file."""
-    t = [math.sin(2 * math.pi * freq * i / sr) for i in range(int(duration * sr))]
-    ints = array.array("h", [int(max(-1.0, min(1.0, x)) * 32767) for x in t])
-    path.parent.mkdir(parents=True, exist_ok=True)
-    with wave.open(str(path), "wb") as wf:
-        wf.setnchannels(1)
-        wf.setsampwidth(2)
-        wf.setframerate(sr)
-        wf.writeframes(ints.tobytes())
 
-
-def _make_stems(directory, sr=48000):
-    freqs = {"vocals": 440, "drums": 220, "bass": 110, "other": 330}
-    for name, freq in freqs.items():
-        _write_tone(directory / f"{name}.wav", freq, sr=sr)
-
-def test_mix(tmp_path):
-    inp = tmp_path / "input"
-    _make_stems(inp)
+def test_mix(tmp_path, stems):
+    inp = stems()
     out = tmp_path / "out"
     report = process(inp, out)
     mix_file = out / "mix.wav"
@@ -43,11 +24,26 @@ def test_mix(tmp_path):
     assert "tracks" in report
 
 
-def test_resample_to_48k(tmp_path):
+def test_resample_to_48k(tmp_path, stems):
     soxr = pytest.importorskip("soxr")  # type: ignore
-    inp = tmp_path / "input"
-    _make_stems(inp, sr=44100)
+    inp = stems(sr=44100, duration=1)  # only the output rate is checked
     out = tmp_path / "out"
     process(inp, out)
     with wave.open(str(out / "mix.wav"), "rb") as wf:
         assert wf.getframerate() == 48000
+
+
+def test_measure_cached(tmp_path, monkeypatch):
+    from mix import _measure
+
+    monkeypatch.setenv("MIX_CACHE_DIR", str(tmp_path / "cache"))
+    wav = tmp_path / "tone.wav"
+    write_tone(wav, 440, duration=1)
+    first = _measure(wav)
+    assert list((tmp_path / "cache" / "loudnorm").glob("*.json"))
+
+    def _no_ffmpeg(*args, **kwargs):
+        raise AssertionError("ffmpeg should not run on a cache hit")
+
+    monkeypatch.setattr("mix.subprocess.run", _no_ffmpeg)
+    assert _measure(wav) == first
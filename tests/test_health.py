@@ -1,3 +1,4 @@
+import sys
 import wave
 from pathlib import Path
 
@@ -6,6 +7,19 @@ import pytest
 from mix import health
 
 
+@pytest.fixture(autouse=True)
+def _no_nvml(monkeypatch):
+    # keep a locally installed pynvml from reporting the real GPU
+    monkeypatch.setitem(sys.modules, "pynvml", None)
+
+
+@pytest.fixture(autouse=True)
+def _fresh_gpu_cache():
+    health.invalidate_cache()
+    yield
+    health.invalidate_cache()
+
+
 def _create_wav(path: Path, sr: int) -> None:
     with wave.open(str(path), "wb") as wf:
         wf.setnchannels(1)
@@ -62,3 +76,132 @@ def test_gpu_memory(monkeypatch):
     monkeypatch.setattr(health, "torch", FakeTorch())
     errors = health.run_preflight_checks(min_gpu_mem_mb=1, min_disk_mb=0)
     assert any("GPU" in e for e in errors)
+
+
+def test_gpu_queries_cached(monkeypatch):
+    calls = {"available": 0, "mem": 0}
+
+    class FakeCuda:
+        @staticmethod
+        def is_available():
+            calls["available"] += 1
+            return True
+
+        @staticmethod
+        def mem_get_info():
+            calls["mem"] += 1
+            return (2 << 30, 4 << 30)
+
+    class FakeTorch:
+        cuda = FakeCuda()
+
+    monkeypatch.setattr(health, "torch", FakeTorch())
+    assert health.check_gpu(1) is None
+    assert health.check_gpu(1) is None
+    assert calls == {"available": 1, "mem": 1}
+    health.invalidate_cache()
+    assert health.check_gpu(1) is None
+    assert calls == {"available": 2, "mem": 2}
+
+
+def test_sample_rate_early_stop(tmp_path):
+    _create_wav(tmp_path / "a.wav", 22050)
+    _create_wav(tmp_path / "b.wav", 44100)
+    full = health.check_sample_rate(tmp_path)
+    assert "22050" in full and "44100" in full
+    first = health.check_sample_rate(tmp_path, early_stop=True)
+    assert first.count("expected") == 1
+
+
+def _fake_torch(total, reserved, free):
+    class Props:
+        total_memory = total
+        is_integrated = False
+
+    class FakeCuda:
+        @staticmethod
+        def is_available():
+            return True
+
+        @staticmethod
+        def get_device_properties(index):
+            return Props()
+
+        @staticmethod
+        def memory_reserved(index=None):
+            return reserved
+
+        @staticmethod
+        def mem_get_info():
+            return (free, total)
+
+    class FakeTorch:
+        cuda = FakeCuda()
+
+    return FakeTorch()
+
+
+def test_gpu_memory_counts_other_processes(monkeypatch):
+    # nothing reserved in this process, but the device is nearly full
+    monkeypatch.setattr(health, "torch", _fake_torch(16 << 30, 0, 100 << 20))
+    err = health.check_gpu(1024)
+    assert err and "Insufficient GPU memory" in err
+
+
+def test_gpu_memory_prefers_nvml(monkeypatch):
+    class Info:
+        free = 100 << 20
+        total = 16 << 30
+
+    calls = []
+
+    class FakeNvml:
+        @staticmethod
+        def nvmlInit():
+            calls.append("init")
+
+        @staticmethod
+        def nvmlShutdown():
+            calls.append("shutdown")
+
+        @staticmethod
+        def nvmlDeviceGetHandleByIndex(index):
+            return index
+
+        @staticmethod
+        def nvmlDeviceGetMemoryInfo(handle):
+            return Info()
+
+    fake = _fake_torch(16 << 30, 0, 16 << 30)
+
+    def _no_mem_get_info():
+        raise AssertionError("mem_get_info should not be called")
+
+    fake.cuda.mem_get_info = _no_mem_get_info
+    monkeypatch.setitem(sys.modules, "pynvml", FakeNvml)
+    monkeypatch.setattr(health, "torch", fake)
+    assert "Insufficient GPU memory" in health.check_gpu(1024)
+    assert calls == ["init", "shutdown"]
+
+
+def test_sample_rate_missing_dir(tmp_path):
+    assert health.check_sample_rate(tmp_path / "missing") is None
+    errors = health.run_preflight_checks(
+        input_dir=tmp_path / "missing", min_gpu_mem_mb=0, min_disk_mb=0
+    )
+    assert not any("sample rate" in e for e in errors)
+
+
+def test_ffmpeg_lookup_retried_until_found(monkeypatch):
+    found = {"path": None, "calls": 0}
+
+    def which(name):
+        found["calls"] += 1
+        return found["path"]
+
+    monkeypatch.setattr(health.shutil, "which", which)
+    assert health.check_ffmpeg() is not None
+    found["path"] = "/usr/bin/ffmpeg"  # installed in a later cell
+    assert health.check_ffmpeg() is None
+    assert health.check_ffmpeg() is None
+    assert found["calls"] == 2
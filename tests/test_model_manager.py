@@ -2,7 +2,8 @@ import os
 import logging
 import pytest
 
-from mix.model_manager import get_model_path
+from mix import model_manager
+from mix.model_manager import discover_models, get_model_path
 
 
 def _write(path):
@@ -62,3 +63,38 @@ def test_no_model_raises(monkeypatch, tmp_path):
     monkeypatch.delenv("RVC_MODEL", raising=False)
     with pytest.raises(FileNotFoundError):
         get_model_path(default=missing, pattern=str(tmp_path / "*.pth"))
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(model_manager.time, "monotonic", lambda: now[0])
+    discover_models.cache_clear()
+    yield now
+    discover_models.cache_clear()
+
+
+def test_discovery_cached_until_ttl(clock, tmp_path):
+    pattern = str(tmp_path / "*.pth")
+    model_a = _write(tmp_path / "a.pth")
+    assert discover_models(pattern) == [model_a]
+    model_b = _write(tmp_path / "b.pth")
+    assert discover_models(pattern) == [model_a]
+    clock[0] += model_manager.DISCOVERY_TTL
+    assert discover_models(pattern) == [model_a, model_b]
+
+
+def test_discovery_cache_clear(clock, tmp_path):
+    pattern = str(tmp_path / "*.pth")
+    model_a = _write(tmp_path / "a.pth")
+    assert discover_models(pattern) == [model_a]
+    model_b = _write(tmp_path / "b.pth")
+    discover_models.cache_clear()
+    assert discover_models(pattern) == [model_a, model_b]
+
+
+def test_discovery_miss_not_cached(clock, tmp_path):
+    pattern = str(tmp_path / "*.pth")
+    assert discover_models(pattern) == []
+    model_a = _write(tmp_path / "a.pth")
+    assert discover_models(pattern) == [model_a]
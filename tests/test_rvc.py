@@ -1,6 +1,9 @@
 from array import array
 import math
 
+import numpy as np
+import pytest
+
 from mix.rvc import RVCInferenceConfig, peak_guard, time_align, run
 
 
@@ -40,3 +43,39 @@ def test_run_pipeline():
     assert out.typecode == 'f'
     assert len(out) == len(audio)
     assert _max_abs(out) <= limit + 1e-6
+
+
+def test_time_align_recovers_early_target():
+    ref = array('f', [0.0] * 1000)
+    ref[110] = 1.0
+    tgt = array('f', [0.0] * 1000)
+    tgt[100] = 1.0  # target leads by 10 samples
+    aligned = time_align(ref, tgt, sr=1000, max_shift=0.05)
+    assert len(aligned) == len(ref)
+    assert aligned.index(1.0) == 110
+
+
+def _inplace_model(x):
+    x *= 2.0
+    return x
+
+
+@pytest.mark.parametrize("make", [
+    lambda: array('f', [0.1 * math.sin(0.01 * i) for i in range(1000)]),
+    lambda: (0.1 * np.sin(0.01 * np.arange(1000))).astype(np.float32),
+])
+def test_run_protects_caller_buffer(make):
+    audio = make()
+    before = np.array(audio, dtype=np.float32)
+    with pytest.raises(ValueError):
+        run(_inplace_model, audio, RVCInferenceConfig(sr=1000))
+    assert np.array_equal(np.asarray(audio, dtype=np.float32), before)
+
+
+def test_run_inplace_model_on_limited_copy():
+    # limiting allocates a fresh array, which the model may reuse
+    audio = array('f', [2.0 * math.sin(0.01 * i) for i in range(1000)])
+    before = array('f', audio)
+    out = run(_inplace_model, audio, RVCInferenceConfig(sr=1000))
+    assert audio == before
+    assert len(out) == len(audio)